@@ -89,6 +89,9 @@ class VideoSummarizer {
 			await this.handleError(error instanceof Error ? error : new Error(String(error)));
 			Deno.exit(1);
 		} finally {
+			// Stop the Python summarizer process
+			await this.pythonIntegration.close();
+
 			// Close database connection
 			if (this.database) {
 				this.database.close();
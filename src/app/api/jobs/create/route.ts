@@ -124,7 +124,7 @@ async function findPythonExecutable(): Promise<string | null> {
 async function runPythonSummarizer(pythonPath: string, videoUrl: string): Promise<string> {
   return new Promise((resolve, reject) => {
     const scriptPath = path.join(process.cwd(), 'video_summarizer.py');
-    const child = spawn(pythonPath, [scriptPath, videoUrl], {
+    const child = spawn(pythonPath, [scriptPath, videoUrl, '--assemble'], {
       stdio: 'pipe',
       env: { ...process.env }
     });
@@ -142,7 +142,12 @@ async function runPythonSummarizer(pythonPath: string, videoUrl: string): Promis
 
     child.on('close', (code) => {
       if (code === 0) {
-        resolve(output);
+        try {
+          // --assemble adds the complete markdown document as `summary`
+          resolve(JSON.parse(output).summary);
+        } catch {
+          reject(new Error('Python script returned invalid JSON'));
+        }
       } else {
         reject(new Error(`Python script failed with code ${code}: ${error}`));
       }
@@ -1,5 +1,8 @@
 // yaml-parser.ts - YAML front matter parser utility
-import { parse as parseYaml } from "https://deno.land/std@0.218.0/yaml/mod.ts";
+import {
+	parse as parseYaml,
+	stringify as stringifyYaml,
+} from "https://deno.land/std@0.218.0/yaml/mod.ts";
 import { Logger } from "./logger.ts";
 
 export interface MarkdownFrontMatter {
@@ -90,6 +93,13 @@ export class YamlParser {
 		}
 	}
 
+	/**
+	 * Build markdown content with YAML front matter (inverse of parseMarkdownContent)
+	 */
+	buildMarkdownContent(frontMatter: MarkdownFrontMatter, content: string): string {
+		return `---\n${stringifyYaml(frontMatter)}---\n\n${content}`;
+	}
+
 	/**
 	 * Get all markdown files from a directory
 	 */
@@ -1,6 +1,29 @@
 // video/python-integration.ts - Python script integration with auto-detection
+import { TextLineStream } from "https://deno.land/std@0.218.0/streams/text_line_stream.ts";
 import { PythonEnvironment, VideoProcessingResult } from "../types.ts";
 import { Logger } from "../utils/logger.ts";
+import { MarkdownFrontMatter, YamlParser } from "../utils/yaml-parser.ts";
+
+/**
+ * One response line from `video_summarizer.py --serve`
+ */
+interface SummarizerResponse {
+	id: number;
+	front_matter?: MarkdownFrontMatter;
+	body?: string;
+	generated_tags?: string[];
+	error?: string;
+}
+
+/**
+ * Long-lived summarizer process and the requests waiting on it
+ */
+interface SummarizerServer {
+	process: Deno.ChildProcess;
+	writer: WritableStreamDefaultWriter<Uint8Array>;
+	pending: Map<number, (response: SummarizerResponse) => void>;
+	stderr: string;
+}
 
 export class PythonIntegrationError extends Error {
 	constructor(message: string) {
@@ -11,10 +34,14 @@ export class PythonIntegrationError extends Error {
 
 export class PythonIntegration {
 	private logger: Logger;
+	private yamlParser: YamlParser;
 	private pythonEnv: PythonEnvironment | null = null;
+	private server: SummarizerServer | null = null;
+	private nextRequestId = 0;
 
 	constructor() {
 		this.logger = Logger.getInstance();
+		this.yamlParser = new YamlParser();
 	}
 
 	/**
@@ -169,73 +196,40 @@ export class PythonIntegration {
 		this.logger.video(`Summarizing video: ${title || videoUrl}`);
 
 		try {
-			const args = ["video_summarizer.py", videoUrl];
-
-			// Add metadata if provided
-			if (metadata) {
-				args.push("--metadata", JSON.stringify(metadata));
-			}
-
-			const command = new Deno.Command(this.pythonEnv.pythonPath, {
-				args,
-				env: {
-					"GOOGLE_CLOUD_PROJECT_ID": googleCloudProjectId,
-				},
-				stdout: "piped",
-				stderr: "piped",
-			});
+			const pythonResult = await this.requestSummary(videoUrl, googleCloudProjectId, metadata);
 
-			const { stdout, stderr, success } = await command.output();
-
-			if (!success) {
-				const errorOutput = new TextDecoder().decode(stderr);
-				this.logger.error(`Python script failed: ${errorOutput}`);
+			if (pythonResult.error !== undefined) {
+				this.logger.error(`Python script failed: ${pythonResult.error}`);
 
 				return {
 					success: false,
 					videoUrl,
 					title: title || videoUrl,
-					error: this.parseErrorMessage(errorOutput),
+					error: this.parseErrorMessage(pythonResult.error),
 				};
 			}
 
-			const outputText = new TextDecoder().decode(stdout);
-
-			try {
-				// Parse JSON response from Python script
-				const pythonResult = JSON.parse(outputText);
-
-				// Generate output filename
-				const filename = this.generateOutputFilename(videoUrl, title);
-				const fullPath = `${outputPath}/${filename}`;
+			// Generate output filename
+			const filename = this.generateOutputFilename(videoUrl, title);
+			const fullPath = `${outputPath}/${filename}`;
 
-				// Save summary to file
-				await Deno.writeTextFile(fullPath, pythonResult.summary);
-
-				this.logger.success(`Summary saved to ${filename}`);
+			// Assemble front matter and body, then save summary to file
+			const markdown = this.yamlParser.buildMarkdownContent(
+				pythonResult.front_matter ?? {},
+				pythonResult.body ?? "",
+			);
+			await Deno.writeTextFile(fullPath, markdown);
 
-				return {
-					success: true,
-					videoUrl,
-					title: title || videoUrl,
-					outputFile: fullPath,
-					generatedTags: pythonResult.generated_tags,
-					frontMatter: pythonResult.front_matter,
-				};
-			} catch (_parseError) {
-				// Fallback: treat as plain text (backward compatibility)
-				const filename = this.generateOutputFilename(videoUrl, title);
-				const fullPath = `${outputPath}/${filename}`;
-				await Deno.writeTextFile(fullPath, outputText);
+			this.logger.success(`Summary saved to ${filename}`);
 
-				this.logger.success(`Summary saved to ${filename}`);
-				return {
-					success: true,
-					videoUrl,
-					title: title || videoUrl,
-					outputFile: fullPath,
-				};
-			}
+			return {
+				success: true,
+				videoUrl,
+				title: title || videoUrl,
+				outputFile: fullPath,
+				generatedTags: pythonResult.generated_tags,
+				frontMatter: pythonResult.front_matter,
+			};
 		} catch (error) {
 			const errorMessage = error instanceof Error ? error.message : String(error);
 			this.logger.error(`Error processing video: ${errorMessage}`);
@@ -249,6 +243,114 @@ export class PythonIntegration {
 		}
 	}
 
+	/**
+	 * Send one video to the summarizer process and wait for its response
+	 */
+	private async requestSummary(
+		videoUrl: string,
+		googleCloudProjectId: string,
+		metadata?: Record<string, unknown>,
+	): Promise<SummarizerResponse> {
+		if (!this.server) {
+			this.server = this.startServer(googleCloudProjectId);
+		}
+
+		const server = this.server;
+		const id = this.nextRequestId++;
+		const response = new Promise<SummarizerResponse>((resolve) => server.pending.set(id, resolve));
+
+		try {
+			const request = JSON.stringify({ id, url: videoUrl, metadata }) + "\n";
+			await server.writer.write(new TextEncoder().encode(request));
+		} catch (error) {
+			server.pending.delete(id);
+			throw error;
+		}
+
+		return response;
+	}
+
+	/**
+	 * Start `video_summarizer.py --serve` so the model is initialized once for all videos
+	 */
+	private startServer(googleCloudProjectId: string): SummarizerServer {
+		this.logger.debug("Starting Python summarizer process...");
+
+		const child = new Deno.Command(this.pythonEnv!.pythonPath, {
+			args: ["video_summarizer.py", "--serve"],
+			env: {
+				"GOOGLE_CLOUD_PROJECT_ID": googleCloudProjectId,
+			},
+			stdin: "piped",
+			stdout: "piped",
+			stderr: "piped",
+		}).spawn();
+
+		const server: SummarizerServer = {
+			process: child,
+			writer: child.stdin.getWriter(),
+			pending: new Map(),
+			stderr: "",
+		};
+
+		// Keep stderr for error reporting
+		(async () => {
+			for await (const chunk of child.stderr.pipeThrough(new TextDecoderStream())) {
+				server.stderr += chunk;
+			}
+		})();
+
+		// Hand each response line to the request waiting on its id
+		(async () => {
+			const lines = child.stdout
+				.pipeThrough(new TextDecoderStream())
+				.pipeThrough(new TextLineStream());
+
+			for await (const line of lines) {
+				if (!line.trim()) {
+					continue;
+				}
+
+				try {
+					const response = JSON.parse(line) as SummarizerResponse;
+					const resolve = server.pending.get(response.id);
+					if (resolve) {
+						server.pending.delete(response.id);
+						resolve(response);
+					}
+				} catch (_parseError) {
+					this.logger.debug(`Ignoring non-JSON summarizer output: ${line}`);
+				}
+			}
+
+			// Process exited: fail anything still waiting on it
+			if (this.server === server) {
+				this.server = null;
+			}
+
+			for (const [id, resolve] of server.pending) {
+				resolve({ id, error: server.stderr || "Python summarizer exited unexpectedly" });
+			}
+			server.pending.clear();
+		})();
+
+		return server;
+	}
+
+	/**
+	 * Stop the summarizer process once it has answered all pending requests
+	 */
+	async close(): Promise<void> {
+		const server = this.server;
+		if (!server) {
+			return;
+		}
+
+		this.server = null;
+		await server.writer.close();
+		await server.process.status;
+	}
+
 	/**
 	 * Parse error message to provide helpful feedback
 	 */
@@ -5,21 +5,75 @@ This script takes a YouTube video URL and generates a comprehensive summary
 using Google Cloud's Vertex AI Gemini model.
 """
 
-import vertexai
-from vertexai.generative_models import GenerativeModel, Part
+from __future__ import annotations
+
 import os
 import sys
 import argparse
+import asyncio
+import functools
 import logging
-from typing import Optional, Dict, List
-from dotenv import load_dotenv
+import re
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional, Dict, List, NamedTuple, TextIO, Tuple
+from urllib.parse import urlsplit
+import hashlib
 import json
-import yaml
+import orjson
+import time
+
+# Vertex AI pulls in grpc/protobuf; it is imported on first use so --help and
+# argument/environment errors return without paying for it
+if TYPE_CHECKING:
+    from vertexai.generative_models import GenerativeModel, Part
 
 # --- Constants ---
 DEFAULT_MODEL = "gemini-1.5-flash-002"
 DEFAULT_LOCATION = "us-central1"
 SUPPORTED_PLATFORMS = ["youtube.com", "youtu.be", "vimeo.com"]
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "raindrop-summarizer")
+DEFAULT_CACHE_TTL = 86400  # seconds
+# Separates the streamed markdown preview from the final JSON payload on stdout
+STREAM_SENTINEL = "---END-SUMMARY---"
+BATCH_POLL_INTERVAL = 30  # seconds between batch prediction job state checks
+DEFAULT_CONCURRENCY = 8  # concurrent online requests for multi-URL runs
+
+# Registered domain -> platform name; subdomains (m., music., player., ...) match too
+_HOST_TO_PLATFORM = {
+    "youtube.com": "YouTube",
+    "youtu.be": "YouTube",
+    "vimeo.com": "Vimeo",
+    "tiktok.com": "TikTok",
+    "twitch.tv": "Twitch",
+    "dailymotion.com": "Dailymotion",
+    "ted.com": "TED",
+}
+
+# Compiled once at import; used for every URL and model response
+_YT_RE = re.compile(r'(?:https?://)?(?:www\.|m\.)?(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)([^&\n?#]+)')
+_VIMEO_RE = re.compile(r'(?:https?://)?(?:www\.|player\.)?vimeo\.com/(?:video/)?(\d+)')
+# Strings that can be emitted as plain (unquoted) YAML scalars
+_YAML_PLAIN_RE = re.compile(r'[A-Za-z_/][\w ./+-]*')
+_YAML_RESERVED = {"true", "false", "yes", "no", "on", "off", "y", "n", "null", "~"}
+
+# Characters that cannot appear verbatim inside a double-quoted YAML scalar:
+# the quote and backslash plus everything outside YAML's printable set
+# (C0/C1 controls, DEL, surrogates, BOM and non-characters) and the Unicode
+# line/paragraph separators, which YAML would otherwise fold
+_YAML_UNSAFE_RE = re.compile('["\\\\\x00-\x1f\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]')
+_YAML_SHORT_ESCAPES = {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+# Tag array in the model response, either fenced as ```json or an inline
+# array of JSON strings (so prose like "[see below]" is not mistaken for tags)
+_TAGS_RE = re.compile(
+    r'```json\s*(?P<fenced>\[.*?\])\s*```'
+    r'|(?P<inline>\[\s*"(?:[^"\\]|\\.)*"(?:\s*,\s*"(?:[^"\\]|\\.)*")*\s*\])',
+    re.DOTALL,
+)
 
 # Enhanced prompt template for professional markdown output with tag generation
 TAG_GENERATION_PROMPT = """Analyze this video and provide ONLY the following two items:
@@ -52,10 +106,6 @@ Format the response exactly as:
 SUMMARY_PROMPT = """
 # 📹 [Video title]
 
-> **Video URL**: [Insert the video URL here]  
-> **Generated**: [Current date]  
-> **Platform**: [YouTube/Vimeo/etc.]
-
 ---
 
 ## 🎯 Executive Summary
@@ -191,8 +241,23 @@ Replace with actual video content, tools, concepts, and outcomes.
 
 """
 
-# --- Configuration Loading ---
-load_dotenv()
+# Identical for every video, so it is set once on the model as its system
+# instruction instead of being repeated in each request's contents
+SYSTEM_INSTRUCTION = TAG_GENERATION_PROMPT + SUMMARY_PROMPT
+
+# Per-video request text; ${...} slots are filled by build_prompt()
+_REQUEST_PROMPT = string.Template(
+    "Video URL: ${video_url}\n"
+    "Platform: ${platform}\n"
+)
+
+# Summary header inserted under the title by build_result(), so these values
+# come from the request rather than from whatever the model echoes back
+_SUMMARY_HEADER = string.Template(
+    "> **Video URL**: ${video_url}  \n"
+    "> **Generated**: ${current_date}  \n"
+    "> **Platform**: ${platform}"
+)
 
 # Setup logging
 logging.basicConfig(
@@ -217,6 +282,87 @@ class VideoProcessingError(VideoSummarizerError):
     pass
 
 
+class LLMCache:
+    """Disk-backed cache of model responses, one JSON file per request key.
+    
+    Entries live under ``~/.cache/raindrop-summarizer/<key>.json`` and hold the
+    raw response text, the tags parsed from it and an expiry timestamp. Keys are
+    built from the canonical video identity (see ``canonical_video_key``) so the
+    different URL spellings of one video share a single entry.
+    """
+    
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+    
+    @classmethod
+    def from_env(cls) -> Optional["LLMCache"]:
+        """Create a cache from RAINDROP_CACHE_ENABLED / RAINDROP_CACHE_TTL.
+        
+        Returns:
+            LLMCache: Configured cache, or None if caching is not enabled
+            
+        Raises:
+            ConfigurationError: If RAINDROP_CACHE_TTL is not an integer
+        """
+        if os.getenv("RAINDROP_CACHE_ENABLED", "").lower() not in ("1", "true", "yes"):
+            return None
+        
+        try:
+            ttl = int(os.getenv("RAINDROP_CACHE_TTL", DEFAULT_CACHE_TTL))
+        except ValueError:
+            raise ConfigurationError("RAINDROP_CACHE_TTL must be a number of seconds.")
+        
+        return cls(ttl=ttl)
+    
+    @staticmethod
+    def cache_key(model_name: str, video_key: str, prompt: str) -> str:
+        """Return the SHA-256 key identifying a model request."""
+        payload = json.dumps({"model": model_name, "url": video_key, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached entry for key, or None if missing or expired."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+        
+        if not isinstance(entry, dict) or not isinstance(entry.get("response_text"), str):
+            logger.warning(f"Ignoring malformed cache entry {key}")
+            return None
+        
+        expires_at = entry.get("expires_at")
+        if not isinstance(expires_at, (int, float)) or time.time() >= expires_at:
+            return None
+        
+        return entry
+    
+    def set(self, key: str, response_text: str, generated_tags: List[str]) -> None:
+        """Store a model response under key. Write failures are logged, not raised."""
+        entry = {
+            "response_text": response_text,
+            "generated_tags": generated_tags,
+            "expires_at": time.time() + self.ttl,
+        }
+        path = self._path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
+
+
 def validate_environment() -> str:
     """Validate environment variables and return project ID.
     
@@ -226,6 +372,11 @@ def validate_environment() -> str:
     Raises:
         ConfigurationError: If required environment variables are missing
     """
+    # Always read .env: it also carries the RAINDROP_* settings, and variables
+    # already set in the process environment take precedence
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     project_id = os.getenv("GOOGLE_CLOUD_PROJECT_ID")
     
     if not project_id:
@@ -237,6 +388,27 @@ def validate_environment() -> str:
     return project_id
 
 
+def _hostname(url: str) -> str:
+    """Return the lowercased hostname of url without a leading "www."."""
+    try:
+        # Treat scheme-less URLs such as "youtu.be/abc" as host-relative
+        host = urlsplit(url if "//" in url else f"//{url}").hostname or ""
+    except ValueError:
+        # Malformed netloc, e.g. an unterminated IPv6 bracket
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def _match_domain(host: str, domains) -> Optional[str]:
+    """Return the entry of domains that host equals or is a subdomain of."""
+    labels = host.split(".")
+    for i in range(len(labels)):
+        suffix = ".".join(labels[i:])
+        if suffix in domains:
+            return suffix
+    return None
+
+
 def validate_video_url(video_url: str) -> bool:
     """Validate if the URL is from a supported video platform.
     
@@ -246,7 +418,7 @@ def validate_video_url(video_url: str) -> bool:
     Returns:
         bool: True if URL is from supported platform
     """
-    return any(platform in video_url.lower() for platform in SUPPORTED_PLATFORMS)
+    return _match_domain(_hostname(video_url), SUPPORTED_PLATFORMS) is not None
 
 
 def extract_video_id(video_url: str) -> Optional[str]:
@@ -258,28 +430,38 @@ def extract_video_id(video_url: str) -> Optional[str]:
     Returns:
         str: Video ID if found, None otherwise
     """
-    import re
-    
-    # YouTube patterns
-    youtube_patterns = [
-        r'(?:https?:\/\/)?(?:www\.)?(?:m\.)?youtube\.com\/watch\?v=([^&\n?#]+)',
-        r'(?:https?:\/\/)?(?:www\.)?youtu\.be\/([^&\n?#]+)',
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/embed\/([^&\n?#]+)',
-    ]
-    
-    for pattern in youtube_patterns:
-        match = re.search(pattern, video_url)
-        if match:
-            return match.group(1)
+    # YouTube watch, embed and short-link URLs
+    match = _YT_RE.search(video_url)
+    if match:
+        return match.group(1)
     
     # Vimeo pattern
-    vimeo_match = re.search(r'(?:https?:\/\/)?(?:www\.)?vimeo\.com\/(\d+)', video_url)
+    vimeo_match = _VIMEO_RE.search(video_url)
     if vimeo_match:
         return vimeo_match.group(1)
     
     return None
 
 
+def canonical_video_key(video_url: str, platform: str, video_id: Optional[str]) -> str:
+    """Return a key identifying a video independently of its URL spelling.
+    
+    ``https://youtu.be/X`` and ``https://www.youtube.com/watch?v=X`` both map to
+    ``YouTube:X``. URLs without a recognizable video ID are returned unchanged.
+    
+    Args:
+        video_url: URL of the video
+        platform: Platform name detected for the URL
+        video_id: Video ID extracted from the URL, if any
+        
+    Returns:
+        str: Canonical key for the video
+    """
+    if video_id:
+        return f"{platform}:{video_id}"
+    return video_url
+
+
 def initialize_vertex_ai(project_id: str, location: str = DEFAULT_LOCATION) -> GenerativeModel:
     """Initialize Vertex AI and return model instance.
     
@@ -294,135 +476,668 @@ def initialize_vertex_ai(project_id: str, location: str = DEFAULT_LOCATION) -> G
         VideoProcessingError: If initialization fails
     """
     try:
+        import vertexai
+        from vertexai.generative_models import GenerativeModel
+        
         vertexai.init(project=project_id, location=location)
-        model = GenerativeModel(DEFAULT_MODEL)
+        model = GenerativeModel(DEFAULT_MODEL, system_instruction=SYSTEM_INSTRUCTION)
         logger.info(f"Initialized Vertex AI with project: {project_id}")
         return model
     except Exception as e:
         raise VideoProcessingError(f"Failed to initialize Vertex AI: {e}")
 
 
-def generate_summary(model: GenerativeModel, video_url: str, metadata: Optional[Dict] = None) -> Dict[str, any]:
+def detect_platform(video_url: str) -> str:
+    """Detect the video platform from a URL.
+    
+    Args:
+        video_url: URL of the video
+        
+    Returns:
+        str: Platform name, or "Unknown" if not recognized
+    """
+    domain = _match_domain(_hostname(video_url), _HOST_TO_PLATFORM)
+    return _HOST_TO_PLATFORM[domain] if domain else "Unknown"
+
+
+def build_prompt(video_url: str, platform: str) -> str:
+    """Create the per-video request text that accompanies SYSTEM_INSTRUCTION.
+    
+    Args:
+        video_url: URL of the video to summarize
+        platform: Platform name of the video
+        
+    Returns:
+        str: Request prompt text
+    """
+    return _REQUEST_PROMPT.substitute(video_url=video_url, platform=platform)
+
+
+@functools.lru_cache(maxsize=256)
+def _video_part(video_url: str) -> Part:
+    """Return the video Part for a URL, reused when the same video is requested again."""
+    from vertexai.generative_models import Part
+    return Part.from_uri(video_url, mime_type="video/mp4")
+
+
+def summary_cache_key(video_url: str, platform: str, video_id: Optional[str]) -> str:
+    """Return the response cache key for summarizing a video.
+    
+    Keys on the canonical video and the unfilled prompt template so that URL
+    spelling and the generation date do not defeat the cache.
+    """
+    return LLMCache.cache_key(
+        DEFAULT_MODEL,
+        canonical_video_key(video_url, platform, video_id),
+        SYSTEM_INSTRUCTION,
+    )
+
+
+def _yaml_escape_char(match: re.Match) -> str:
+    """Return the YAML double-quoted escape sequence for one character."""
+    char = match.group()
+    if char in _YAML_SHORT_ESCAPES:
+        return _YAML_SHORT_ESCAPES[char]
+    code = ord(char)
+    return f"\\x{code:02x}" if code <= 0xFF else f"\\u{code:04x}"
+
+
+def _yaml_escape(value: any) -> str:
+    """Return value as a YAML scalar, double-quoted unless it is safe as a plain one."""
+    text = str(value)
+    if (
+        _YAML_PLAIN_RE.fullmatch(text)
+        and text == text.strip()
+        and text.lower() not in _YAML_RESERVED
+    ):
+        return text
+    return '"' + _YAML_UNSAFE_RE.sub(_yaml_escape_char, text) + '"'
+
+
+def _emit_front_matter(front_matter: Dict[str, any]) -> str:
+    """Serialize flat front matter (scalars and lists of scalars) as YAML.
+    
+    Args:
+        front_matter: Front matter keys in output order
+        
+    Returns:
+        str: YAML block without the surrounding --- delimiters
+    """
+    lines = []
+    for key, value in front_matter.items():
+        if isinstance(value, (list, tuple)):
+            if not value:
+                lines.append(f"{key}: []\n")
+                continue
+            lines.append(f"{key}:\n")
+            lines.extend(f"  - {_yaml_escape(item)}\n" for item in value)
+        else:
+            lines.append(f"{key}: {_yaml_escape(value)}\n")
+    return "".join(lines)
+
+
+def validate_metadata(metadata: any) -> Optional[Dict]:
+    """Check the shape of Raindrop metadata before it reaches the front matter.
+    
+    Args:
+        metadata: Decoded metadata value, or None
+        
+    Returns:
+        Dict: The metadata unchanged, or None
+        
+    Raises:
+        ConfigurationError: If metadata is not an object or its tags are not a list
+    """
+    if metadata is None:
+        return None
+    if not isinstance(metadata, dict):
+        raise ConfigurationError("'metadata' must be an object")
+    if metadata.get("tags") is not None and not isinstance(metadata["tags"], list):
+        raise ConfigurationError("'metadata.tags' must be a list")
+    return metadata
+
+
+def build_result(
+    video_url: str,
+    response_text: str,
+    metadata: Optional[Dict],
+    platform: str,
+    video_id: Optional[str],
+    current_time: str,
+) -> Dict[str, any]:
+    """Parse a model response into tags, front matter and final markdown.
+    
+    Args:
+        video_url: URL of the summarized video
+        response_text: Raw model response (tag JSON array followed by markdown)
+        metadata: Optional Raindrop metadata (title, tags, created, domain, etc.)
+        platform: Platform name of the video
+        video_id: Video ID extracted from the URL, if any
+        current_time: ISO timestamp recorded as the generation time
+        
+    Returns:
+        Dict: Contains 'front_matter' (dict), 'body' (markdown text), and 'generated_tags' (list)
+        
+    Raises:
+        ConfigurationError: If metadata fails validate_metadata
+    """
+    validate_metadata(metadata)
+    
+    # Extract generated tags from response
+    generated_tags = []
+    summary_content = response_text
+    
+    # One scan finds the tag array, fenced or inline; cut it out by offset
+    match = _TAGS_RE.search(response_text)
+    if match:
+        try:
+            generated_tags = json.loads(match['fenced'] or match['inline'])
+            summary_content = (response_text[:match.start()] + response_text[match.end():]).strip()
+        except json.JSONDecodeError:
+            logger.warning("Could not parse generated tags as JSON")
+    
+    # Put the header under the model's title line, or on top if it wrote none
+    header = _SUMMARY_HEADER.substitute(
+        video_url=video_url,
+        current_date=current_time[:10],
+        platform=platform,
+    )
+    if summary_content.startswith("# "):
+        title, _, rest = summary_content.partition("\n")
+        summary_content = f"{title}\n\n{header}\n\n{rest.lstrip()}"
+    else:
+        summary_content = f"{header}\n\n{summary_content}"
+    
+    # Create front matter
+    existing_tags = (metadata.get('tags') if metadata else None) or []
+    # Combine and deduplicate, keeping existing Raindrop tags first
+    all_tags = list({tag: None for tag in (*existing_tags, *generated_tags)})
+    
+    # Build in output order, adding optional keys only when they have a value
+    front_matter = {
+        'title': (metadata.get('title') if metadata else None) or 'Video Summary',
+        'url': video_url,
+        'platform': platform,
+    }
+    if video_id:
+        front_matter['video_id'] = video_id
+    front_matter['generated'] = current_time
+    if metadata:
+        for source_key, key in (('created', 'raindrop_created'), ('domain', 'domain')):
+            value = metadata.get(source_key)
+            if value is not None:
+                front_matter[key] = value
+    front_matter['tags'] = all_tags
+    
+    return {
+        'front_matter': front_matter,
+        'body': summary_content,
+        'generated_tags': generated_tags,
+    }
+
+
+def assemble_markdown(result: Dict[str, any]) -> str:
+    """Return the summary document: YAML front matter followed by the markdown body.
+    
+    Args:
+        result: Result with 'front_matter' and 'body', as returned by generate_summary
+        
+    Returns:
+        str: Markdown with YAML front matter
+    """
+    return f"---\n{_emit_front_matter(result['front_matter'])}---\n\n{result['body']}"
+
+
+class _SummaryRequest(NamedTuple):
+    """Per-video state shared by the online and batch summary paths."""
+    video_url: str
+    platform: str
+    video_id: Optional[str]
+    video_key: str
+    current_time: str
+    cache_key: Optional[str]
+    cached_text: Optional[str]
+
+
+def _prepare_summary(video_url: str, cache: Optional[LLMCache]) -> _SummaryRequest:
+    """Resolve everything needed before the model call, including the cache lookup.
+    
+    Args:
+        video_url: URL of the video to summarize
+        cache: Optional response cache
+        
+    Returns:
+        _SummaryRequest: 'cached_text' is set on a cache hit
+    """
+    platform = detect_platform(video_url)
+    video_id = extract_video_id(video_url)
+    
+    cache_key = summary_cache_key(video_url, platform, video_id) if cache else None
+    cached = cache.get(cache_key) if cache else None
+    
+    if cached:
+        logger.info(f"Using cached summary for: {video_url}")
+    else:
+        logger.info(f"Generating summary and tags for: {video_url}")
+    
+    return _SummaryRequest(
+        video_url, platform, video_id,
+        canonical_video_key(video_url, platform, video_id),
+        datetime.now().isoformat(),
+        cache_key,
+        cached["response_text"] if cached else None,
+    )
+
+
+def _model_contents(request: _SummaryRequest) -> List[any]:
+    """Return the online model input for a request that missed the cache."""
+    return [build_prompt(request.video_url, request.platform), _video_part(request.video_url)]
+
+
+def _finish_summary(
+    request: _SummaryRequest,
+    response_text: str,
+    metadata: Optional[Dict],
+    cache: Optional[LLMCache],
+) -> Dict[str, any]:
+    """Build the result from a model or cached response and store new responses.
+    
+    Raises:
+        VideoProcessingError: If the response is empty
+    """
+    if not response_text:
+        raise VideoProcessingError("Received empty response from model")
+    
+    result = build_result(
+        request.video_url, response_text, metadata,
+        request.platform, request.video_id, request.current_time,
+    )
+    
+    if cache and request.cached_text is None:
+        cache.set(request.cache_key, response_text, result['generated_tags'])
+    
+    return result
+
+
+def generate_summary(
+    model: GenerativeModel,
+    video_url: str,
+    metadata: Optional[Dict] = None,
+    cache: Optional[LLMCache] = None,
+    stream_output: Optional[TextIO] = None,
+) -> Dict[str, any]:
     """Generate video summary using Vertex AI.
     
     Args:
         model: Initialized GenerativeModel instance
         video_url: URL of the video to summarize
         metadata: Optional Raindrop metadata (title, tags, created, domain, etc.)
+        cache: Optional response cache; a hit skips the model call entirely
+        stream_output: Optional text stream that receives response text as it is generated
         
     Returns:
-        Dict: Contains 'summary' (markdown text), 'generated_tags' (list), and 'front_matter' (dict)
+        Dict: Contains 'front_matter' (dict), 'body' (markdown text), and 'generated_tags' (list)
         
     Raises:
         VideoProcessingError: If summary generation fails
     """
     try:
-        from datetime import datetime
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        current_time = datetime.now().isoformat()
-        
-        # Detect platform
-        platform = "Unknown"
-        if "youtube.com" in video_url.lower() or "youtu.be" in video_url.lower():
-            platform = "YouTube"
-        elif "vimeo.com" in video_url.lower():
-            platform = "Vimeo"
-        elif "tiktok.com" in video_url.lower():
-            platform = "TikTok"
-        elif "twitch.tv" in video_url.lower():
-            platform = "Twitch"
-        elif "dailymotion.com" in video_url.lower():
-            platform = "Dailymotion"
-        elif "ted.com" in video_url.lower():
-            platform = "TED"
-        
-        # Create combined prompt for tag generation and summary
-        full_prompt = TAG_GENERATION_PROMPT + SUMMARY_PROMPT.replace(
-            "> **Video URL**: [Insert the video URL here]",
-            f"> **Video URL**: {video_url}"
-        ).replace(
-            "> **Generated**: [Current date]",
-            f"> **Generated**: {current_date}"
-        ).replace(
-            "> **Platform**: [YouTube/Vimeo/etc.]",
-            f"> **Platform**: {platform}"
-        )
+        request = _prepare_summary(video_url, cache)
+        
+        if request.cached_text is not None:
+            response_text = request.cached_text
+            if stream_output:
+                stream_output.write(response_text)
+                stream_output.flush()
+        else:
+            buf = []
+            for chunk in model.generate_content(_model_contents(request), stream=True):
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # Chunks without text parts (e.g. a bare finish reason)
+                    continue
+                buf.append(text)
+                if stream_output:
+                    stream_output.write(text)
+                    stream_output.flush()
+            response_text = "".join(buf).strip()
         
-        contents = [
-            full_prompt,
-            Part.from_uri(video_url, mime_type="video/mp4"),
-        ]
+        return _finish_summary(request, response_text, metadata, cache)
         
-        # Log to stderr to avoid interfering with stdout summary
-        if logging.getLogger().isEnabledFor(logging.INFO):
-            print(f"Generating summary and tags for: {video_url}", file=sys.stderr)
+    except Exception as e:
+        raise VideoProcessingError(f"Failed to generate summary: {e}")
+
+
+async def generate_summary_async(
+    model: GenerativeModel,
+    video_url: str,
+    metadata: Optional[Dict] = None,
+    cache: Optional[LLMCache] = None,
+) -> Dict[str, any]:
+    """Generate video summary using Vertex AI without blocking the event loop.
+    
+    Async counterpart of generate_summary for concurrent multi-URL runs.
+    
+    Args:
+        model: Initialized GenerativeModel instance
+        video_url: URL of the video to summarize
+        metadata: Optional Raindrop metadata (title, tags, created, domain, etc.)
+        cache: Optional response cache; a hit skips the model call entirely
         
-        response = model.generate_content(contents)
+    Returns:
+        Dict: Contains 'front_matter' (dict), 'body' (markdown text), and 'generated_tags' (list)
         
-        if not response.text:
-            raise VideoProcessingError("Received empty response from model")
+    Raises:
+        VideoProcessingError: If summary generation fails
+    """
+    try:
+        request = _prepare_summary(video_url, cache)
         
-        response_text = response.text.strip()
+        if request.cached_text is not None:
+            response_text = request.cached_text
+        else:
+            response = await model.generate_content_async(_model_contents(request))
+            response_text = (response.text or "").strip()
         
-        # Extract generated tags from response
-        generated_tags = []
-        summary_content = response_text
+        return _finish_summary(request, response_text, metadata, cache)
         
-        import re
+    except Exception as e:
+        raise VideoProcessingError(f"Failed to generate summary: {e}")
+
+
+async def summarize_concurrently(
+    model: GenerativeModel,
+    inputs: List[Tuple[str, Optional[Dict]]],
+    cache: Optional[LLMCache] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> List[Dict[str, any]]:
+    """Summarize many videos with online requests, at most `concurrency` in flight.
+    
+    Args:
+        model: Initialized GenerativeModel instance
+        inputs: (video_url, metadata) pairs to summarize
+        cache: Optional response cache
+        concurrency: Maximum number of simultaneous model requests
         
-        # Look for JSON code block first: ```json [...] ```
-        json_block_match = re.search(r'```json\s*(\[.*?\])\s*```', response_text, re.DOTALL)
-        if json_block_match:
+    Returns:
+        List: One record per input, in input order. Each record is the
+        generate_summary result plus 'url', or {'url', 'error'} on failure.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def summarize_one(video_url: str, metadata: Optional[Dict]) -> Dict[str, any]:
+        async with semaphore:
             try:
-                generated_tags = json.loads(json_block_match.group(1))
-                # Remove the entire JSON code block from the summary content
-                summary_content = response_text.replace(json_block_match.group(0), '').strip()
-            except json.JSONDecodeError:
-                logger.warning("Could not parse generated tags from JSON code block")
-        else:
-            # Look for inline JSON array: [...] 
-            json_match = re.search(r'\[.*?\]', response_text)
-            if json_match:
+                result = await generate_summary_async(model, video_url, metadata, cache)
+                return {'url': video_url, **result}
+            except VideoProcessingError as e:
+                logger.error(f"Processing error for {video_url}: {e}")
+                return {'url': video_url, 'error': str(e)}
+    
+    return await asyncio.gather(*(summarize_one(url, metadata) for url, metadata in inputs))
+
+
+def load_batch_inputs(path: str) -> List[Tuple[str, Optional[Dict]]]:
+    """Read batch inputs from a JSONL file.
+    
+    Each non-empty line is an object with a 'url' key and an optional
+    'metadata' object holding the Raindrop metadata for that video.
+    
+    Args:
+        path: Path to the JSONL file
+        
+    Returns:
+        List: (video_url, metadata) pairs in file order
+        
+    Raises:
+        ConfigurationError: If the file cannot be read or a line is invalid
+    """
+    inputs = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if not isinstance(entry, dict) or not isinstance(entry.get("url"), str) or not entry["url"]:
+                    raise ConfigurationError(f"{path}:{line_number}: expected an object with a 'url' key")
                 try:
-                    generated_tags = json.loads(json_match.group())
-                    # Remove the JSON from the summary content
-                    summary_content = response_text.replace(json_match.group(), '').strip()
-                except json.JSONDecodeError:
-                    logger.warning("Could not parse generated tags as JSON")
-        
-        # Create front matter
-        existing_tags = metadata.get('tags', []) if metadata else []
-        all_tags = list(set(existing_tags + generated_tags))  # Combine and deduplicate
-        
-        # Extract video ID for front matter
-        video_id = extract_video_id(video_url)
-        
-        front_matter = {
-            'title': metadata.get('title', 'Video Summary') if metadata else 'Video Summary',
-            'url': video_url,
-            'platform': platform,
-            'video_id': video_id,
-            'generated': current_time,
-            'raindrop_created': metadata.get('created') if metadata else None,
-            'domain': metadata.get('domain') if metadata else None,
-            'tags': all_tags
-        }
+                    metadata = validate_metadata(entry.get("metadata"))
+                except ConfigurationError as e:
+                    raise ConfigurationError(f"{path}:{line_number}: {e}")
+                inputs.append((entry["url"], metadata))
+    except OSError as e:
+        raise ConfigurationError(f"Could not read batch file {path}: {e}")
+    except json.JSONDecodeError as e:
+        raise ConfigurationError(f"Invalid JSON in batch file {path}: {e}")
+    
+    return inputs
+
+
+def _split_gcs_uri(uri: str) -> Tuple[str, str]:
+    """Split gs://bucket/prefix into (bucket, prefix)."""
+    if not uri.startswith("gs://"):
+        raise ConfigurationError(f"Expected a gs:// URI, got: {uri}")
+    bucket, _, prefix = uri[len("gs://"):].partition("/")
+    return bucket, prefix.strip("/")
+
+
+def run_batch_prediction(
+    project_id: str,
+    inputs: List[Tuple[str, Optional[Dict]]],
+    gcs_uri: str,
+    cache: Optional[LLMCache] = None,
+    poll_interval: int = BATCH_POLL_INTERVAL,
+) -> List[Dict[str, any]]:
+    """Summarize many videos with a single Vertex AI batch prediction job.
+    
+    The requests are written as JSONL under gcs_uri, submitted as one job, and
+    the predictions are parsed exactly like online responses. Videos with a
+    cached response are answered locally and left out of the job, and inputs
+    that resolve to the same video (e.g. youtu.be/X and watch?v=X) share one
+    prediction.
+    
+    Args:
+        project_id: Google Cloud project ID
+        inputs: (video_url, metadata) pairs to summarize
+        gcs_uri: gs:// prefix used for the job's input and output files
+        cache: Optional response cache
+        poll_interval: Seconds between job state checks
         
-        # Clean up None values
-        front_matter = {k: v for k, v in front_matter.items() if v is not None}
+    Returns:
+        List: One record per input, in input order. Each record is the
+        generate_summary result plus 'url', or {'url', 'error'} on failure.
         
-        # Create final markdown with YAML front matter
-        yaml_front_matter = yaml.dump(front_matter, default_flow_style=False, sort_keys=False)
-        final_content = f"---\n{yaml_front_matter}---\n\n{summary_content}"
+    Raises:
+        VideoProcessingError: If the job cannot be submitted or fails
+    """
+    now = datetime.now()
+    
+    records: List[Optional[Dict]] = [None] * len(inputs)
+    requests: List[_SummaryRequest] = []
+    # Canonical video key -> input indexes sharing one prediction
+    pending: Dict[str, List[int]] = {}
+    # URL sent in the job -> canonical video key
+    sent_keys: Dict[str, str] = {}
+    request_lines = []
+    
+    def finish(index: int, response_text: str, store: Optional[LLMCache]) -> bool:
+        request = requests[index]
+        try:
+            result = _finish_summary(request, response_text, inputs[index][1], store)
+        except Exception as e:
+            records[index] = {'url': request.video_url, 'error': f"Failed to build summary: {e}"}
+            return False
+        records[index] = {'url': request.video_url, **result}
+        return True
+    
+    for index, (video_url, metadata) in enumerate(inputs):
+        request = _prepare_summary(video_url, cache)
+        requests.append(request)
+        if request.cached_text is not None:
+            finish(index, request.cached_text, cache)
+            continue
         
-        return {
-            'summary': final_content,
-            'generated_tags': generated_tags,
-            'front_matter': front_matter
-        }
+        if request.video_key not in pending:
+            sent_keys[video_url] = request.video_key
+            request_lines.append(json.dumps({
+                "request": {
+                    "systemInstruction": {"parts": [{"text": SYSTEM_INSTRUCTION}]},
+                    "contents": [{
+                        "role": "user",
+                        "parts": [
+                            {"text": build_prompt(video_url, request.platform)},
+                            {"fileData": {"mimeType": "video/mp4", "fileUri": video_url}},
+                        ],
+                    }],
+                },
+            }))
+        pending.setdefault(request.video_key, []).append(index)
+    
+    if pending:
+        try:
+            import vertexai
+            from google.cloud import storage
+            from vertexai.batch_prediction import BatchPredictionJob
+            
+            vertexai.init(project=project_id, location=DEFAULT_LOCATION)
+            client = storage.Client(project=project_id)
+            bucket_name, prefix = _split_gcs_uri(gcs_uri)
+            run_prefix = "/".join(p for p in (prefix, f"raindrop-batch-{now.strftime('%Y%m%d%H%M%S')}") if p)
+            
+            bucket = client.bucket(bucket_name)
+            bucket.blob(f"{run_prefix}/input.jsonl").upload_from_string(
+                "\n".join(request_lines) + "\n", content_type="application/jsonl"
+            )
+            
+            job = BatchPredictionJob.submit(
+                source_model=DEFAULT_MODEL,
+                input_dataset=f"gs://{bucket_name}/{run_prefix}/input.jsonl",
+                output_uri_prefix=f"gs://{bucket_name}/{run_prefix}/output",
+            )
+            logger.info(f"Submitted batch prediction job {job.resource_name} for {len(request_lines)} videos")
+            
+            while not job.has_ended:
+                time.sleep(poll_interval)
+                job.refresh()
+            
+            if not job.has_succeeded:
+                raise VideoProcessingError(f"Batch prediction job failed: {job.error}")
+            
+            output_bucket, output_prefix = _split_gcs_uri(job.output_location)
+            predictions = []
+            for blob in client.list_blobs(output_bucket, prefix=output_prefix):
+                if blob.name.endswith(".jsonl"):
+                    predictions.extend(blob.download_as_text().splitlines())
+        except VideoSummarizerError:
+            raise
+        except Exception as e:
+            raise VideoProcessingError(f"Batch prediction failed: {e}")
         
-    except Exception as e:
-        raise VideoProcessingError(f"Failed to generate summary: {e}")
+        for line in predictions:
+            if not line.strip():
+                continue
+            try:
+                prediction = json.loads(line)
+                parts = prediction["request"]["contents"][0]["parts"]
+                video_url = next(p["fileData"]["fileUri"] for p in parts if "fileData" in p)
+            except (json.JSONDecodeError, KeyError, IndexError, StopIteration) as e:
+                logger.warning(f"Skipping unreadable batch prediction line: {e}")
+                continue
+            
+            indexes = pending.pop(sent_keys.get(video_url), None)
+            if not indexes:
+                continue
+            
+            # The job is already paid for: a bad prediction or input only fails its own records
+            try:
+                if prediction.get("status"):
+                    raise VideoProcessingError(prediction["status"])
+                candidates = prediction.get("response", {}).get("candidates", [])
+                response_text = "".join(
+                    p.get("text", "") for c in candidates[:1] for p in c.get("content", {}).get("parts", [])
+                ).strip()
+            except Exception as e:
+                for index in indexes:
+                    records[index] = {'url': inputs[index][0], 'error': str(e)}
+                continue
+            
+            # Fan the one prediction out to every input for this video,
+            # caching it with the first record that builds successfully
+            store = cache
+            for index in indexes:
+                if finish(index, response_text, store):
+                    store = None
+    
+    for indexes in pending.values():
+        for index in indexes:
+            records[index] = {'url': inputs[index][0], 'error': "No prediction returned for this video"}
+    
+    return records
+
+
+def emit_json(obj: any, indent: bool = False) -> None:
+    """Write obj to stdout as a single JSON document followed by a newline.
+    
+    Args:
+        obj: JSON-serializable value
+        indent: Pretty-print with two-space indentation
+    """
+    sys.stdout.flush()  # Keep ordering with any text already printed
+    sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def serve(
+    model: GenerativeModel,
+    cache: Optional[LLMCache] = None,
+    assemble: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> None:
+    """Answer summary requests read from stdin, one JSON object per line, until EOF.
+    
+    Each request is {"id": ..., "url": ..., "metadata": {...}}; each response is
+    written as one line holding the request's 'id' plus either the
+    generate_summary result or an 'error' message. Keeping one process alive
+    reuses the initialized model across videos. Requests run on a thread pool
+    (the model call is network-bound), so responses may arrive out of order.
+    
+    Args:
+        model: Initialized GenerativeModel instance
+        cache: Optional response cache
+        assemble: Also include the full markdown document as 'summary'
+        concurrency: Maximum number of requests processed at once
+    """
+    write_lock = threading.Lock()
+    
+    def respond(response: Dict[str, any]) -> None:
+        with write_lock:
+            emit_json(response)
+    
+    def handle(line: str) -> None:
+        request_id = None
+        try:
+            request = orjson.loads(line)
+            if not isinstance(request, dict):
+                raise VideoProcessingError("Request must be a JSON object")
+            request_id = request.get("id")
+            if not request.get("url"):
+                raise VideoProcessingError("Request is missing 'url'")
+            metadata = validate_metadata(request.get("metadata"))
+            result = generate_summary(model, request["url"], metadata, cache)
+            if assemble:
+                result['summary'] = assemble_markdown(result)
+            respond({'id': request_id, **result})
+        except Exception as e:
+            # Every request must be answered or its caller waits forever
+            logger.error(f"Processing error: {e}")
+            respond({'id': request_id, 'error': str(e)})
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for line in sys.stdin:
+            if line.strip():
+                executor.submit(handle, line)
 
 
 def main() -> None:
@@ -434,17 +1149,59 @@ def main() -> None:
 Examples:
   %(prog)s "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
   %(prog)s "https://youtu.be/dQw4w9WgXcQ" --verbose
+  %(prog)s "https://youtu.be/dQw4w9WgXcQ" "https://vimeo.com/76979871"
+  %(prog)s --batch urls.jsonl
+  %(prog)s --batch urls.jsonl --batch-gcs-uri gs://my-bucket/raindrop
+  %(prog)s --serve < requests.jsonl
         """
     )
     
     parser.add_argument(
-        "video_url",
-        help="The full URL of the video to summarize"
+        "video_urls",
+        nargs="*",
+        metavar="video_url",
+        help="The full URL of the video to summarize; several URLs are summarized "
+             "concurrently and printed as one JSON result per line"
     )
     parser.add_argument(
         "--metadata",
         help="JSON string containing Raindrop metadata (title, tags, created, domain, etc.)"
     )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="JSONL file of {\"url\": ..., \"metadata\": {...}} lines to summarize; "
+             "prints one JSON result per line"
+    )
+    parser.add_argument(
+        "--batch-gcs-uri",
+        help="gs:// prefix for Vertex AI batch prediction input/output files; without it "
+             "--batch sends concurrent online requests (default: $RAINDROP_BATCH_GCS_URI)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum simultaneous online requests for multi-URL and --serve runs "
+             f"(default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep the model loaded and answer {\"id\", \"url\", \"metadata\"} JSON "
+             "requests from stdin, one JSON response line per request"
+    )
+    parser.add_argument(
+        "--assemble",
+        action="store_true",
+        help="Also include the complete markdown document (front matter + body) as 'summary'"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the markdown to stdout as it is generated, followed by "
+             f"a {STREAM_SENTINEL} line and the JSON result"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -458,6 +1215,13 @@ Examples:
     
     args = parser.parse_args()
     
+    if sum(map(bool, (args.video_urls, args.batch, args.serve))) != 1:
+        parser.error("provide video URLs, --batch FILE or --serve")
+    if len(args.video_urls) != 1 and (args.metadata or args.stream):
+        parser.error("--metadata and --stream apply to a single video URL")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    
     # Configure logging based on verbosity
     if args.verbose:
         logging.getLogger().setLevel(logging.INFO)
@@ -465,31 +1229,75 @@ Examples:
     try:
         # Validate environment
         project_id = validate_environment()
+        batch_gcs_uri = args.batch_gcs_uri or os.getenv("RAINDROP_BATCH_GCS_URI")
+        cache = LLMCache.from_env()
+        
+        # Read and check all inputs before starting Vertex AI, so bad arguments
+        # exit immediately instead of waiting for the init thread
+        inputs = None
+        if args.batch:
+            inputs = load_batch_inputs(args.batch)
+        elif len(args.video_urls) > 1:
+            inputs = [(url, None) for url in args.video_urls]
         
-        # Parse metadata if provided
         metadata = None
         if args.metadata:
             try:
-                metadata = json.loads(args.metadata)
-            except json.JSONDecodeError as e:
+                metadata = validate_metadata(orjson.loads(args.metadata))
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Invalid metadata JSON: {e}")
                 sys.exit(1)
         
-        # Validate video URL
-        if not validate_video_url(args.video_url):
+        if len(args.video_urls) == 1 and not validate_video_url(args.video_urls[0]):
             logger.warning(
                 f"URL may not be from a supported platform. "
                 f"Supported: {', '.join(SUPPORTED_PLATFORMS)}"
             )
         
-        # Initialize Vertex AI
-        model = initialize_vertex_ai(project_id)
+        if args.batch and batch_gcs_uri:
+            # Batch prediction jobs do not need an online model
+            for record in run_batch_prediction(project_id, inputs, batch_gcs_uri, cache):
+                if args.assemble and 'body' in record:
+                    record['summary'] = assemble_markdown(record)
+                emit_json(record)
+            return
+        
+        # Import and initialize Vertex AI on a worker thread; only started once
+        # the inputs are known to be valid, since the interpreter joins it on exit
+        init_executor = ThreadPoolExecutor(max_workers=1)
+        model_future = init_executor.submit(initialize_vertex_ai, project_id)
+        init_executor.shutdown(wait=False)
+        
+        if args.serve:
+            serve(model_future.result(), cache, args.assemble, args.concurrency)
+            return
+        
+        if inputs is not None:
+            model = model_future.result()
+            records = asyncio.run(summarize_concurrently(model, inputs, cache, args.concurrency))
+            for record in records:
+                if args.assemble and 'body' in record:
+                    record['summary'] = assemble_markdown(record)
+                emit_json(record)
+            return
+        
+        # Wait for Vertex AI initialization started above
+        model = model_future.result()
         
         # Generate summary with tags
-        result = generate_summary(model, args.video_url, metadata)
+        result = generate_summary(
+            model, args.video_urls[0], metadata, cache,
+            stream_output=sys.stdout if args.stream else None,
+        )
+        
+        if args.assemble:
+            result['summary'] = assemble_markdown(result)
+        
+        if args.stream:
+            print(f"\n{STREAM_SENTINEL}")
         
         # Output structured result as JSON (this is captured by the Deno script)
-        print(json.dumps(result, indent=2))
+        emit_json(result, indent=True)
         
     except ConfigurationError as e:
         logger.error(f"Configuration error: {e}")
@@ -507,4 +1315,3 @@ Examples:
 
 if __name__ == "__main__":
     main()
-